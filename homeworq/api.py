@@ -19,6 +19,28 @@ from .tasks import Task, get_registered_task, get_registered_tasks
 
 logger = logging.getLogger(__name__)
 
+# Status values used in hot per-row loops and query filters, resolved once
+# instead of via Enum attribute access on every call.
+_STATUS_COMPLETED = Status.COMPLETED
+_STATUS_FAILED = Status.FAILED
+
+async def _logs_to_schemas(logs: List[models.Log]) -> List[Log]:
+    """Serialize prefetched logs, building each unique job schema only once.
+
+    Many logs usually belong to few jobs, so the per-row cost drops to a
+    dict lookup instead of a full Job schema construction per log.
+    """
+    job_schemas: Dict[str, Job] = {}
+    result = []
+    for log in logs:
+        job_schema = job_schemas.get(log.job_id)
+        if job_schema is None:
+            job_schema = await log.job.to_schema()
+            job_schemas[log.job_id] = job_schema
+        result.append(await log.to_schema(job_schema))
+    return result
+
+
 API_DESCRIPTION = """
 This is the API documentation for **homeworq**.
 It's built on top of the OpenAPI standard and provides
@@ -201,7 +223,7 @@ async def create_api(hq: HQ) -> FastAPI:
             .limit(3)
             .order_by("-started_at")
         )
-        return [await log.to_schema() for log in logs]
+        return await _logs_to_schemas(logs)
 
     @app.get("/api/analytics/upcoming-executions", tags=["Analytics"])
     async def get_upcoming_executions():
@@ -216,24 +238,28 @@ async def create_api(hq: HQ) -> FastAPI:
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=30)
 
-        logs = (
+        # Only two columns are needed, so fetch plain value tuples instead
+        # of hydrating full Log model instances per row.
+        rows = (
             await models.Log.filter(
                 started_at__gte=start_date, started_at__lte=end_date
             )
             .limit(100)
             .order_by("-started_at")
+            .values_list("started_at", "status")
         )
 
         history = defaultdict(lambda: defaultdict(int))
-        for log in logs:
-            date = log.started_at.date()
-            history[date][log.status] += 1
+        for started_at, status in rows:
+            history[started_at.date()][status] += 1
 
+        # Buckets are keyed by the Status enum, so read them back with the
+        # same keys (the old "COMPLETED"/"FAILED" strings never matched).
         return [
             {
                 "date": date.isoformat(),
-                "completed": data.get("COMPLETED", 0),
-                "failed": data.get("FAILED", 0),
+                "completed": data.get(_STATUS_COMPLETED, 0),
+                "failed": data.get(_STATUS_FAILED, 0),
                 "total": sum(data.values()),
             }
             for date, data in sorted(history.items())
@@ -249,9 +275,9 @@ async def create_api(hq: HQ) -> FastAPI:
         for log in logs:
             task_name = log.job.task_name
             distribution[task_name]["total"] += 1
-            if log.status == Status.COMPLETED:
+            if log.status == _STATUS_COMPLETED:
                 distribution[task_name]["completed"] += 1
-            elif log.status == Status.FAILED:
+            elif log.status == _STATUS_FAILED:
                 distribution[task_name]["failed"] += 1
 
         return [
@@ -262,7 +288,7 @@ async def create_api(hq: HQ) -> FastAPI:
     async def get_error_rate():
         """Get the current error rate."""
         total = await models.Log.all().count()
-        failed = await models.Log.filter(status=Status.FAILED).count()
+        failed = await models.Log.filter(status=_STATUS_FAILED).count()
 
         if total == 0:
             return {"error_rate": 0}
@@ -357,9 +383,14 @@ async def create_api(hq: HQ) -> FastAPI:
         if not job:
             raise HTTPException(404, f"Job #{job_id} not found")
 
-        # Delete related logs and the job using model managers
-        await models.Log.filter(job_id=job_id).delete()
-        await models.Job.filter(id=job_id).delete()
+        # Delete related logs and the job in one transaction — a single
+        # commit instead of one per statement, and no window where the
+        # logs are gone but the job still exists
+        from tortoise.transactions import in_transaction
+
+        async with in_transaction():
+            await models.Log.filter(job_id=job_id).delete()
+            await models.Job.filter(id=job_id).delete()
         return {"status": "success"}
 
     @app.get("/api/logs", response_model=PaginatedResponse[Log], tags=["Logs"])
@@ -381,7 +412,7 @@ async def create_api(hq: HQ) -> FastAPI:
         logs = await query.offset(offset).limit(limit).order_by("-started_at")
 
         return PaginatedResponse(
-            items=[await log.to_schema() for log in logs],
+            items=await _logs_to_schemas(logs),
             total=total,
             offset=offset,
             limit=limit,
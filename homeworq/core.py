@@ -15,6 +15,19 @@ from .tasks import execute_task
 
 logger = logging.getLogger(__name__)
 
+# Seconds per fixed-length time unit, used to turn the common interval-only
+# schedule into a single timedelta without building kwargs per call.
+_FIXED_UNIT_SECONDS = {
+    TimeUnit.SECONDS: 1,
+    TimeUnit.MINUTES: 60,
+    TimeUnit.HOURS: 3600,
+    TimeUnit.DAYS: 86400,
+    TimeUnit.WEEKS: 604800,
+}
+
+# Databases whose schema DDL has already been generated in this process.
+_initialized_dbs: Set[str] = set()
+
 
 class HQ(BaseModel):
     """
@@ -53,6 +66,7 @@ class HQ(BaseModel):
         self._api_task: Optional[asyncio.Task] = None
         self._api: Optional[FastAPI] = None
         self._executing_jobs: Set[str] = set()
+        self._stop_event: asyncio.Event = asyncio.Event()
         setup_logging(self.settings.log_path, self.settings.debug)
 
     async def _init_api(self) -> FastAPI:
@@ -100,8 +114,19 @@ class HQ(BaseModel):
         """
         now = datetime.now(timezone.utc)
 
+        # Fast path: interval-only schedules are the common case and need no
+        # cron parsing or time-of-day handling.
+        if not job.schedule_cron and not job.schedule_at:
+            if not job.schedule_unit or not job.schedule_interval:
+                raise ValueError("Job must have either interval or cron schedule")
+            seconds = _FIXED_UNIT_SECONDS.get(job.schedule_unit)
+            if seconds is not None:
+                return now + timedelta(seconds=seconds * job.schedule_interval)
+            interval = {job.schedule_unit.value: job.schedule_interval}
+            return now + timedelta(**interval)
+
         if job.schedule_cron:
-            parser = CronParser(job.schedule_cron)
+            parser = CronParser.get(job.schedule_cron)
             return parser.get_next_run(after=now)
 
         if job.schedule_at:
@@ -121,13 +146,6 @@ class HQ(BaseModel):
                     )
             return next_run
 
-        # Handle interval-based scheduling
-        if not job.schedule_unit or not job.schedule_interval:
-            raise ValueError("Job must have either interval or cron schedule")
-
-        interval = {job.schedule_unit.value: job.schedule_interval}
-        return now + timedelta(**interval)
-
     async def _can_run_job(self, job: Job) -> bool:
         """
         Check if a job is eligible to run.
@@ -178,82 +196,82 @@ class HQ(BaseModel):
         Returns:
             Log: Execution log entry
         """
-        now = datetime.now(timezone.utc)
-        self._executing_jobs.add(job.id)
+        started_at = datetime.now(timezone.utc)
 
-        try:
-            # Update job's last_run time
-            job.last_run = now
-            await job.save()
+        # Update job's last_run time
+        job.last_run = started_at
+        await job.save()
 
-            # Create execution log
-            execution = await models.Log.create(
-                job=job,
-                status=Status.RUNNING,
-                started_at=now,
-                retries=0,
-            )
+        max_retries = job.max_retries or 0
+        retry_count = 0
+        retries_used = 0
+        last_error = None
+        result = None
+        status = Status.FAILED
 
-            max_retries = job.max_retries or 0
-            retry_count = 0
-            last_error = None
+        # Execute with retries
+        while retry_count <= max_retries:
+            try:
+                if job.timeout:
+                    result = await asyncio.wait_for(
+                        execute_task(job.task_name, job.params),
+                        timeout=job.timeout,
+                    )
+                else:
+                    result = await execute_task(job.task_name, job.params)
 
-            # Execute with retries
-            while retry_count <= max_retries:
-                try:
-                    if job.timeout:
-                        result = await asyncio.wait_for(
-                            execute_task(job.task_name, job.params),
-                            timeout=job.timeout,
-                        )
-                    else:
-                        result = await execute_task(job.task_name, job.params)
-
-                    execution.status = Status.COMPLETED
-                    execution.result = result
-                    execution.retries = retry_count
-                    break
+                status = Status.COMPLETED
+                retries_used = retry_count
+                break
 
-                except asyncio.TimeoutError:
-                    logger.warning(
-                        "Job %s timed out (attempt %d/%d)",
-                        job.id,
-                        retry_count + 1,
-                        max_retries + 1,
-                    )
-                    last_error = "Job execution timed out"
-
-                except Exception as e:
-                    logger.error(
-                        "Job %s failed (attempt %d/%d): %s",
-                        job.id,
-                        retry_count + 1,
-                        max_retries + 1,
-                        str(e),
-                        exc_info=True,
-                    )
-                    last_error = str(e)
-
-                retry_count += 1
-                if retry_count <= max_retries:
-                    delay = min(300, (2**retry_count) + random.uniform(0, 1))
-                    await asyncio.sleep(delay)
-
-            # Update execution status
-            if execution.status != Status.COMPLETED:
-                execution.status = Status.FAILED
-                execution.error = last_error
-
-            execution.completed_at = datetime.now(timezone.utc)
-            execution.duration = (
-                execution.completed_at - execution.started_at
-            ).total_seconds()
-            await execution.save()
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "Job %s timed out (attempt %d/%d)",
+                    job.id,
+                    retry_count + 1,
+                    max_retries + 1,
+                )
+                last_error = "Job execution timed out"
 
-            return execution
+            except Exception as e:
+                logger.error(
+                    "Job %s failed (attempt %d/%d): %s",
+                    job.id,
+                    retry_count + 1,
+                    max_retries + 1,
+                    str(e),
+                    exc_info=True,
+                )
+                last_error = str(e)
+
+            retry_count += 1
+            if retry_count <= max_retries:
+                delay = min(300, (2**retry_count) + random.uniform(0, 1))
+                await asyncio.sleep(delay)
+
+        # Write the execution log in a single INSERT once the outcome is
+        # known, instead of creating a RUNNING row up front and updating it.
+        completed_at = datetime.now(timezone.utc)
+        execution = models.Log(
+            job_id=job.id,
+            status=status,
+            started_at=started_at,
+            completed_at=completed_at,
+            duration=(completed_at - started_at).total_seconds(),
+            result=result if status == Status.COMPLETED else None,
+            error=last_error if status == Status.FAILED else None,
+            retries=retries_used,
+        )
 
-        finally:
-            self._executing_jobs.remove(job.id)
+        # Hand the row to the background writer so bursts of completions
+        # share one bulk INSERT; fall back to a direct save when the
+        # writer is not running (e.g. one-off executions in tests).
+        if models.log_writer.running:
+            models.log_writer.enqueue(execution)
+        else:
+            await execution.save()
+
+        return execution
 
     async def _scheduler_loop(self) -> None:
         """
@@ -267,9 +285,6 @@ class HQ(BaseModel):
 
         while self._running:
             try:
-                # Clean up completed tasks
-                running_tasks = {task for task in running_tasks if not task.done()}
-
                 # Get all active jobs
                 jobs = await models.Job.filter(end_date__isnull=True).prefetch_related(
                     "logs"
@@ -278,12 +293,54 @@ class HQ(BaseModel):
                 # Check and execute due jobs
                 for job in jobs:
                     if await self._can_run_job(job):
-                        # Execute job in separate task and track it
+                        # Mark the job as executing before yielding control so
+                        # a later tick cannot launch it a second time. The set
+                        # membership check plus add happens without an
+                        # intervening await, so no lock is needed on the
+                        # single-threaded event loop.
+                        self._executing_jobs.add(job.id)
+                        # Execute job in separate task and track it; each
+                        # task removes itself from the set when it finishes,
+                        # so no per-tick sweep over handles is needed.
                         task = asyncio.create_task(self._handle_job_execution(job))
                         running_tasks.add(task)
-
-                # Small delay before next check
-                await asyncio.sleep(1)
+                        task.add_done_callback(running_tasks.discard)
+
+                # Sleep until the soonest known next_run instead of waking at
+                # a fixed rate. Jobs that are currently executing are left
+                # out: their next_run is stale (in the past) until the run
+                # finishes, and including it would pin the delay at the floor
+                # and hammer the jobs query for the whole execution. A job
+                # gated by a future start_date likewise cannot run before
+                # that date, so the date itself is its wakeup time. The wait
+                # is capped so jobs created or changed elsewhere (e.g. via
+                # the API) are still picked up promptly, and jobs without a
+                # next_run keep the old 1s cadence.
+                delay = 1.0
+                now = datetime.now(timezone.utc)
+                pending = []
+                for job in jobs:
+                    if job.id in self._executing_jobs:
+                        continue
+                    next_run = job.next_run
+                    if job.start_date and job.start_date > now and next_run:
+                        next_run = max(next_run, job.start_date)
+                    pending.append(next_run)
+                if pending and all(pending):
+                    soonest = min(pending)
+                    until_due = (soonest - now).total_seconds()
+                    # A next_run still in the past here means the job was
+                    # vetoed for some other reason; fall back to the 1s
+                    # cadence instead of spinning at the floor.
+                    if until_due > 0:
+                        delay = min(max(until_due, 0.1), 30.0)
+
+                # Wait on the stop event rather than a bare sleep so a
+                # shutdown request interrupts the wait immediately.
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
 
             except Exception as e:
                 logger.error("Scheduler loop error: %s", str(e), exc_info=True)
@@ -312,11 +369,14 @@ class HQ(BaseModel):
             logger.error(
                 "Error handling job %s execution: %s", job.id, str(e), exc_info=True
             )
+        finally:
+            self._executing_jobs.discard(job.id)
 
     async def _handle_signal(self, sig):
         """Handle interrupt signals gracefully."""
         logger.info("Received signal %s. Initiating shutdown...", sig.name)
         self._running = False
+        self._stop_event.set()
 
     async def run(self) -> None:
         """
@@ -345,13 +405,15 @@ class HQ(BaseModel):
             )
 
         self._running = True
+        self._stop_event.clear()
+        models.log_writer.start()
         self._scheduler_task = asyncio.create_task(self._scheduler_loop())
         logger.info("Scheduler started")
 
         try:
-            # Run until stopped
-            while self._running:
-                await asyncio.sleep(1)
+            # Run until stopped — no periodic wakeups, just wait for the
+            # stop event set by a signal or stop().
+            await self._stop_event.wait()
         finally:
             await self.stop()
 
@@ -378,6 +440,7 @@ class HQ(BaseModel):
 
         logger.info("Stopping scheduler...")
         self._running = False
+        self._stop_event.set()
 
         # Cancel scheduler task
         if self._scheduler_task:
@@ -391,6 +454,9 @@ class HQ(BaseModel):
                 except asyncio.CancelledError:
                     pass
 
+        # Flush any queued log rows before connections go away
+        await models.log_writer.stop()
+
         # Stop API server
         if self._api_task:
             logger.info("Stopping API server...")
@@ -422,8 +488,7 @@ class HQ(BaseModel):
 
         # Create default jobs if any
         logger.info("Creating/updating default jobs...")
-        for job_create in self.defaults:
-            await models.Job.from_schema(job_create, is_default=True)
+        await models.Job.bulk_upsert_defaults(self.defaults)
 
         return self
 
@@ -472,4 +537,12 @@ class HQ(BaseModel):
             modules={"models": ["homeworq.models"]},
             table_name_generator=lambda cls: f"hq_{cls.__name__.lower()}s",
         )
-        await Tortoise.generate_schemas()
+        # The CREATE TABLE IF NOT EXISTS round trips only need to run once
+        # per database; re-entering the context manager skips them. In-memory
+        # databases are excluded: they come up empty on every Tortoise.init,
+        # so their schemas must always be regenerated.
+        if ":memory:" in self.settings.db_uri:
+            await Tortoise.generate_schemas()
+        elif self.settings.db_uri not in _initialized_dbs:
+            await Tortoise.generate_schemas()
+            _initialized_dbs.add(self.settings.db_uri)
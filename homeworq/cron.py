@@ -1,105 +1,161 @@
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from weakref import WeakValueDictionary
+
+FIELDS = ("minute", "hour", "day", "month", "day_of_week")
+RANGES = {
+    "minute": (0, 59),
+    "hour": (0, 23),
+    "day": (1, 31),
+    "month": (1, 12),
+    "day_of_week": (0, 6),  # 0 = Sunday
+}
+
+
+def _parse_field(field: str, field_name: str) -> Tuple[int, ...]:
+    """Parse a single cron field into a tuple of valid values."""
+    field_range = RANGES[field_name]
+    result = set()
+
+    # Handle multiple comma-separated values
+    for part in field.split(","):
+        if part == "*":
+            result.update(range(field_range[0], field_range[1] + 1))
+            continue
+
+        # Handle step values
+        if "/" in part:
+            range_part, step = part.split("/")
+            step = int(step)
+
+            if range_part == "*":
+                start, end = field_range
+            else:
+                if "-" in range_part:
+                    start, end = map(int, range_part.split("-"))
+                else:
+                    start = int(range_part)
+                    end = field_range[1]
 
+            result.update(range(start, end + 1, step))
+            continue
 
-class CronParser:
-    """Parser for cron expressions that calculates the next run time."""
+        # Handle ranges
+        if "-" in part:
+            start, end = map(int, part.split("-"))
+            result.update(range(start, end + 1))
+            continue
 
-    FIELDS = ["minute", "hour", "day", "month", "day_of_week"]
-    RANGES = {
-        "minute": (0, 59),
-        "hour": (0, 23),
-        "day": (1, 31),
-        "month": (1, 12),
-        "day_of_week": (0, 6),  # 0 = Sunday
-    }
+        # Handle single values
+        result.add(int(part))
 
-    def __init__(self, cron_expr: str):
-        self.original = cron_expr
-        self.fields = self._parse_expr(cron_expr)
+    # Validate values are within allowed range
+    for value in result:
+        if not field_range[0] <= value <= field_range[1]:
+            raise ValueError(
+                f"Value {value} out of range for {field_name} "
+                f"({field_range[0]}-{field_range[1]})"
+            )
 
-    def _parse_field(self, field: str, field_name: str) -> List[int]:
-        """Parse a single cron field into a list of valid values."""
-        field_range = self.RANGES[field_name]
-        result = set()
+    return tuple(sorted(result))
 
-        # Handle multiple comma-separated values
-        for part in field.split(","):
-            if part == "*":
-                result.update(range(field_range[0], field_range[1] + 1))
-                continue
 
-            # Handle step values
-            if "/" in part:
-                range_part, step = part.split("/")
-                step = int(step)
+@lru_cache(maxsize=512)
+def _parse_expr(expr: str) -> Dict[str, Tuple[int, ...]]:
+    """Parse a full cron expression into structured format.
 
-                if range_part == "*":
-                    start, end = field_range
-                else:
-                    if "-" in range_part:
-                        start, end = map(int, range_part.split("-"))
-                    else:
-                        start = int(range_part)
-                        end = field_range[1]
+    Cron expressions are immutable, so results are cached by the raw
+    string — parsers constructed repeatedly for the same expression
+    (e.g. per scheduler tick) skip all split/range/set work.
+    """
+    parts = expr.strip().split()
+    if len(parts) != 5:
+        raise ValueError(
+            "Invalid cron expression. Must have 5 fields: "
+            "minute hour day month day_of_week"
+        )
 
-                result.update(range(start, end + 1, step))
-                continue
+    return {
+        field: _parse_field(value, field) for field, value in zip(FIELDS, parts)
+    }
 
-            # Handle ranges
-            if "-" in part:
-                start, end = map(int, part.split("-"))
-                result.update(range(start, end + 1))
-                continue
 
-            # Handle single values
-            result.add(int(part))
+@lru_cache(maxsize=512)
+def _field_masks(expr: str) -> Dict[str, int]:
+    """Build a per-field bitmask (bit n set = value n allowed) for an expression.
 
-        # Validate values are within allowed range
-        for value in result:
-            if not field_range[0] <= value <= field_range[1]:
-                raise ValueError(
-                    f"Value {value} out of range for {field_name} "
-                    f"({field_range[0]}-{field_range[1]})"
-                )
+    Cron values all fit in <= 60 bits, so a single int per field lets the
+    next-value search run as a couple of C-level bit operations instead of
+    iterating Python containers.
+    """
+    masks = {}
+    for field, values in _parse_expr(expr).items():
+        mask = 0
+        for value in values:
+            mask |= 1 << value
+        masks[field] = mask
+    return masks
 
-        return sorted(list(result))
 
-    def _parse_expr(self, expr: str) -> dict:
-        """Parse full cron expression into structured format."""
-        parts = expr.strip().split()
-        if len(parts) != 5:
-            raise ValueError(
-                "Invalid cron expression. Must have 5 fields: "
-                "minute hour day month day_of_week"
-            )
+# Shared parser instances interned by expression string. Weak references
+# keep the pool from pinning parsers for expressions no job uses anymore.
+_PARSER_POOL: "WeakValueDictionary[str, CronParser]" = WeakValueDictionary()
 
-        return {
-            field: self._parse_field(value, field)
-            for field, value in zip(self.FIELDS, parts)
-        }
+
+class CronParser:
+    """Parser for cron expressions that calculates the next run time."""
+
+    FIELDS = FIELDS
+    RANGES = RANGES
+
+    def __init__(self, cron_expr: str):
+        self.original = cron_expr
+        self.fields = _parse_expr(cron_expr)
+        self.masks = _field_masks(cron_expr)
+
+    @classmethod
+    def get(cls, cron_expr: str) -> "CronParser":
+        """Return a shared parser for the expression, creating it on first use."""
+        parser = _PARSER_POOL.get(cron_expr)
+        if parser is None:
+            parser = cls(cron_expr)
+            _PARSER_POOL[cron_expr] = parser
+        return parser
 
     def _get_next_value(
-        self, current: int, allowed: List[int], rollover: bool = False
+        self, current: int, mask: int, rollover: bool = False
     ) -> Tuple[int, bool]:
-        """Get next allowed value in sequence."""
-        for value in allowed:
-            if value > current or rollover:
-                return value, False
-        if allowed:  # If we didn't find a larger value, roll over to first
-            return allowed[0], True
-        raise ValueError("No valid values found")
+        """Get the smallest allowed value >= current, or roll over to first.
+
+        Operates on the field's bitmask: masking out bits below `current`
+        and isolating the lowest set bit replaces any per-value Python
+        iteration with a few arbitrary-precision int ops implemented in C.
+        Accepting the current value (rather than only strictly larger
+        ones) lets get_next_run fall through to the next field when a
+        field already matches.
+        """
+        if not mask:
+            raise ValueError("No valid values found")
+        if not rollover:
+            higher = mask & ~((1 << current) - 1)
+            if higher:
+                return (higher & -higher).bit_length() - 1, False
+            return (mask & -mask).bit_length() - 1, True
+        return (mask & -mask).bit_length() - 1, False
 
     def get_next_run(self, after: Optional[datetime] = None) -> datetime:
         """Calculate the next run time after the given datetime."""
         if after is None:
             after = datetime.now(timezone.utc)
 
-        current = after.replace(second=0, microsecond=0)
+        # Start at the next whole minute so the result is strictly after
+        # the given time.
+        current = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
 
         while True:
             minute, minute_rollover = self._get_next_value(
-                current.minute, self.fields["minute"]
+                current.minute, self.masks["minute"]
             )
 
             if minute_rollover or minute > current.minute:
@@ -110,7 +166,7 @@ class CronParser:
                 continue
 
             hour, hour_rollover = self._get_next_value(
-                current.hour, self.fields["hour"], minute_rollover
+                current.hour, self.masks["hour"], minute_rollover
             )
 
             if hour_rollover or hour > current.hour:
@@ -122,9 +178,10 @@ class CronParser:
                 )
                 continue
 
-            # Check if current day of month and day of week are valid
-            day_valid = current.day in self.fields["day"]
-            dow_valid = current.weekday() in self.fields["day_of_week"]
+            # Check if current day of month and day of week are valid —
+            # single-bit mask tests instead of membership scans
+            day_valid = (self.masks["day"] >> current.day) & 1
+            dow_valid = (self.masks["day_of_week"] >> current.weekday()) & 1
 
             if not (day_valid and dow_valid):
                 current = current + timedelta(days=1)
@@ -136,21 +193,14 @@ class CronParser:
 
             month_valid = current.month in self.fields["month"]
             if not month_valid:
-                if current.month == 12:
-                    current = current.replace(
-                        year=current.year + 1,
-                        month=1,
-                        day=1,
-                        hour=self.fields["hour"][0],
-                        minute=self.fields["minute"][0],
-                    )
-                else:
-                    current = current.replace(
-                        month=current.month + 1,
-                        day=1,
-                        hour=self.fields["hour"][0],
-                        minute=self.fields["minute"][0],
-                    )
+                # Jump to the first day of the next month: 32 days from the
+                # 1st always lands in the following month regardless of its
+                # length, and timedelta handles the year wrap for free.
+                current = (current.replace(day=1) + timedelta(days=32)).replace(
+                    day=1,
+                    hour=self.fields["hour"][0],
+                    minute=self.fields["minute"][0],
+                )
                 continue
 
             # If we get here, we've found a valid time
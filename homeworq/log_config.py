@@ -1,8 +1,27 @@
+import atexit
 import logging
+import queue
+import re
 import sys
-from copy import copy
+import threading
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+# Active listener draining the log queue on its background thread.
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """Stop the queue listener, flushing any queued records."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 class CustomFormatter(logging.Formatter):
     """
@@ -18,32 +37,147 @@ class CustomFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    # Padded forms of the five known level strings, built once at class
+    # creation instead of re-running the format machinery per record.
+    _PADDED = {level: level.ljust(8) for level in COLORS}
+
     def __init__(self, *args, use_colors=True, **kwargs):
         super().__init__(*args, **kwargs)
         self.use_colors = use_colors
+        # Final levelname strings precomputed once per level: padded and,
+        # when colored, wrapped in a single merged color+reset sequence.
+        # format() then just looks them up instead of rebuilding the same
+        # string for every record.
+        self._level_cache = {
+            level: f"{color}{padded}{self.RESET}"
+            for (level, color), padded in zip(
+                self.COLORS.items(), self._PADDED.values()
+            )
+        }
+        self._plain_cache = self._PADDED
+        # use_colors is fixed at construction, so pick the cache once
+        # rather than branching on every record
+        self._cache = self._level_cache if use_colors else self._plain_cache
 
     def format(self, record):
-        record_copy = copy(record)
-        levelname = record_copy.levelname
+        # Only levelname (and message for access logs) is mutated, so a
+        # save/restore around the base format call is far cheaper than
+        # copy.copy'ing the whole record on every emit
+        levelname = record.levelname
+
+        # Convert uvicorn's levelprefix to our standard levelname if
+        # present. uvicorn sets these as plain instance attributes, so a
+        # single __dict__ probe replaces hasattr's getattr-plus-exception
+        # path (slow in the common negative case).
+        levelprefix = record.__dict__.get("levelprefix")
+        if levelprefix is not None:
+            levelname = levelprefix.strip()
+
+        orig_levelname = record.levelname
+        record.levelname = self._cache.get(levelname) or levelname.ljust(8)
+        try:
+            # Handle uvicorn access logs specially
+            if record.__dict__.get("client_addr") is not None:
+                record.message = f"{record.request_line} | {record.status_code}"
+
+            return super().format(record)
+        finally:
+            record.levelname = orig_levelname
+
+
+# SGR (color) escape sequences as emitted by CustomFormatter
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+class _StripAnsiStream:
+    """Thin writable wrapper that drops SGR color codes on the way out.
+
+    Lets the file handler share the colored console formatter — records
+    are formatted once per handler either way, but only one formatter
+    needs to be configured and the file stays free of escape codes.
+    """
+
+    __slots__ = ("_stream",)
+
+    def __init__(self, stream):
+        self._stream = stream
 
-        # Convert uvicorn's levelprefix to our standard levelname if present
-        if hasattr(record_copy, "levelprefix"):
-            levelname = record_copy.levelprefix.strip()
+    def write(self, data: str) -> int:
+        return self._stream.write(_ANSI_RE.sub("", data))
 
-        # Standardize the length of the level name
-        levelname = f"{levelname:<8}"
+    def flush(self) -> None:
+        self._stream.flush()
 
-        if self.use_colors and levelname.strip() in self.COLORS:
-            levelname = f"{self.COLORS[levelname.strip()]}{levelname}{self.RESET}"
+    def close(self) -> None:
+        self._stream.close()
 
-        record_copy.levelname = levelname
 
-        # Handle uvicorn access logs specially
-        if hasattr(record_copy, "client_addr"):
-            message = f"{record_copy.request_line} | {record_copy.status_code}"
-            record_copy.message = message
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches writes behind a large stream buffer.
 
-        return super().format(record_copy)
+    Records accumulate in the buffer and reach the disk in few large
+    writes instead of one syscall per record. ERROR-or-worse records
+    flush immediately so nothing important sits in the buffer; a daemon
+    timer flushes the rest periodically, and close() flushes the tail.
+    """
+
+    FLUSH_INTERVAL = 30.0
+
+    def __init__(
+        self,
+        filename,
+        mode="a",
+        encoding=None,
+        delay=False,
+        buffer_size=65536,
+        flush_level=logging.ERROR,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        super().__init__(filename, mode, encoding=encoding, delay=delay)
+        self._flush_timer: Optional[threading.Timer] = None
+        self._schedule_flush()
+
+    def _open(self):
+        return _StripAnsiStream(
+            open(
+                self.baseFilename,
+                self.mode,
+                buffering=self.buffer_size,
+                encoding=self.encoding,
+            )
+        )
+
+    def _schedule_flush(self) -> None:
+        self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self._periodic_flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _periodic_flush(self) -> None:
+        self.flush()
+        self._schedule_flush()
+
+    def shouldFlush(self, record) -> bool:
+        return record.levelno >= self.flush_level
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            # Unlike StreamHandler.emit, only flush when the record is
+            # important enough — routine records ride the buffer
+            if self.shouldFlush(record):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        super().close()
 
 
 class CustomAccessFormatter(CustomFormatter):
@@ -67,37 +201,47 @@ def setup_logging(log_path: Optional[str] = None, debug: bool = False) -> None:
     Args:
         log_path: Optional path to log file
         debug: Whether to enable debug logging
+
+    The real file/console handlers live behind a QueueHandler feeding a
+    QueueListener thread, so emitting a record costs a queue.put instead
+    of a blocking write syscall on the event-loop thread.
     """
+    global _listener
+
     # Set up root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
-    # Clear any existing handlers
+    # Clear any existing handlers and stop a previous listener
     root_logger.handlers.clear()
+    _stop_listener()
 
-    # Create formatters
+    # One colored formatter serves both handlers; the file handler's
+    # stream strips the escape codes on write
     console_formatter = CustomFormatter(
         fmt="%(levelname)s%(asctime)s | %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
         use_colors=True,
     )
 
-    file_formatter = CustomFormatter(
-        fmt="%(levelname)s%(asctime)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        use_colors=False,
-    )
-
-    # Configure handlers
+    # Configure the real handlers; they are attached to the listener, not
+    # the root logger
+    handlers = []
     if log_path:
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler = BufferedFileHandler(log_path)
+        file_handler.setFormatter(console_formatter)
+        handlers.append(file_handler)
 
     # Always add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
+
+    # Producers only enqueue; the listener thread does the actual I/O
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Set specific log levels for different components
     logging.getLogger("homeworq").setLevel(logging.DEBUG if debug else logging.INFO)
@@ -106,10 +250,14 @@ def setup_logging(log_path: Optional[str] = None, debug: bool = False) -> None:
     logging.getLogger("aiosqlite").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=1)
 def get_uvicorn_log_config() -> dict:
     """
     Get Uvicorn logging config that matches our standard format.
 
+    The config never changes at runtime, so it is built once and the same
+    dict is returned on every subsequent call.
+
     Args:
         debug: Whether to enable debug logging
 
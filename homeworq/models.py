@@ -1,13 +1,43 @@
+import asyncio
+import hashlib
+import logging
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 
 from tortoise import fields, models
 
+from .schemas import _STATUS_LOOKUP, _UNIT_LOOKUP
 from .schemas import Job as JobSchema
 from .schemas import JobCreate, JobOptions, JobSchedule
 from .schemas import Log as LogSchema
 from .schemas import Status, TimeUnit
 from .tasks import get_registered_task
 
+logger = logging.getLogger(__name__)
+
+
+def _canonicalize(value: Any) -> Any:
+    """Recursively convert a params value into a hashable, deterministic form."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _canonicalize(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_canonicalize(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _default_hash(task: str, params_key: Tuple) -> str:
+    """Hash the identity-defining fields of a default job.
+
+    blake2b is faster than sha256 for these small inputs, and the
+    lru_cache means repeated hashing of the same default (startup does it
+    for every upsert check) is a dict hit.
+    """
+    return hashlib.blake2b(
+        repr((task, params_key)).encode(), digest_size=16
+    ).hexdigest()
+
 
 class BaseModel(models.Model):
     id = fields.IntField(pk=True)
@@ -35,22 +65,72 @@ class Job(BaseModel):
 
     @staticmethod
     def create_default_hash(schema: JobCreate) -> str:
-        """Create a unique hash for a default job configuration"""
-        import hashlib
-        import json
+        """Create a unique hash for a default job configuration.
+
+        Only the task name and params define the job's essential nature;
+        they are canonicalized into a hashable key so the cached helper
+        can skip re-hashing configurations it has already seen.
+        """
+        return _default_hash(schema.task, _canonicalize(schema.params))
 
-        # Create a deterministic representation of the JobCreate object
-        # Only include fields that define the job's essential nature
-        hash_dict = {
-            "task": schema.task,
-            "params": schema.params,
-        }
+    @classmethod
+    async def bulk_upsert_defaults(cls, schemas: List[JobCreate]) -> None:
+        """Create or update all default jobs with a single bulk upsert.
 
-        # Create a deterministic JSON string
-        hash_input = json.dumps(hash_dict, sort_keys=True)
+        Instead of one round-trip per default job, this builds unsaved Job
+        instances keyed by their default hash and issues one
+        ``INSERT ... ON CONFLICT DO UPDATE`` statement for the whole batch.
+        """
+        if not schemas:
+            return
 
-        # Create SHA-256 hash
-        return hashlib.sha256(hash_input.encode()).hexdigest()
+        instances = []
+        for schema in schemas:
+            schedule_dict = {
+                "schedule_interval": None,
+                "schedule_unit": None,
+                "schedule_at": None,
+                "schedule_cron": None,
+            }
+            if isinstance(schema.schedule, str):
+                schedule_dict["schedule_cron"] = schema.schedule
+            else:
+                # Three fixed fields — direct reads skip model_dump's
+                # full serialization pass
+                schedule_dict["schedule_interval"] = schema.schedule.interval
+                schedule_dict["schedule_unit"] = schema.schedule.unit
+                schedule_dict["schedule_at"] = schema.schedule.at
+
+            instances.append(
+                cls(
+                    id=cls.create_default_hash(schema),
+                    task_name=schema.task,
+                    params=schema.params,
+                    timeout=schema.options.timeout,
+                    max_retries=schema.options.max_retries,
+                    start_date=schema.options.start_date,
+                    end_date=schema.options.end_date,
+                    next_run=datetime.now(),  # Set initial next_run time
+                    **schedule_dict,
+                )
+            )
+
+        await cls.bulk_create(
+            instances,
+            on_conflict=["id"],
+            update_fields=[
+                "task_name",
+                "params",
+                "timeout",
+                "max_retries",
+                "start_date",
+                "end_date",
+                "schedule_interval",
+                "schedule_unit",
+                "schedule_at",
+                "schedule_cron",
+            ],
+        )
 
     @classmethod
     async def from_schema(
@@ -63,11 +143,14 @@ class Job(BaseModel):
         if isinstance(schema.schedule, str):
             schedule_dict["schedule_cron"] = schema.schedule
         else:
-            for k, v in schema.schedule.model_dump().items():
-                schedule_dict[f"schedule_{k}"] = v
+            schedule_dict["schedule_interval"] = schema.schedule.interval
+            schedule_dict["schedule_unit"] = schema.schedule.unit
+            schedule_dict["schedule_at"] = schema.schedule.at
+
+        # Compute the default hash once; the create() call below reuses it
+        default_hash = cls.create_default_hash(schema) if is_default else None
 
         if is_default:
-            default_hash = cls.create_default_hash(schema)
             # Try to find existing default job by its ID
             existing_job = await cls.get_or_none(id=default_hash)
             if existing_job:
@@ -94,7 +177,7 @@ class Job(BaseModel):
 
         # Create new job
         job = await cls.create(
-            id=cls.create_default_hash(schema) if is_default else None,
+            id=default_hash,
             task_name=schema.task,
             params=schema.params,
             timeout=schema.options.timeout,
@@ -107,26 +190,34 @@ class Job(BaseModel):
         return job
 
     async def to_schema(self) -> JobSchema:
-        """Convert DB model to Pydantic schema"""
+        """Convert DB model to Pydantic schema.
+
+        The data is a round-trip of our own validated rows, so the nested
+        schemas are built with model_construct, skipping field validators
+        and coercion. Untrusted input (JobCreate) keeps full validation.
+        """
         if self.schedule_cron:
             schedule = self.schedule_cron
         elif self.schedule_interval and self.schedule_unit:
-            schedule = JobSchedule(
+            # The unit usually arrives as a TimeUnit already; the lookup
+            # covers raw strings since model_construct won't coerce them
+            unit = self.schedule_unit
+            schedule = JobSchedule.model_construct(
                 interval=self.schedule_interval,
-                unit=self.schedule_unit,
+                unit=_UNIT_LOOKUP.get(unit, unit),
                 at=self.schedule_at,
             )
         else:
             raise ValueError("Job must have either cron or interval schedule")
 
-        options = JobOptions(
+        options = JobOptions.model_construct(
             timeout=self.timeout,
             max_retries=self.max_retries,
             start_date=self.start_date,
             end_date=self.end_date,
         )
 
-        return JobSchema(
+        return JobSchema.model_construct(
             id=self.id,
             task=get_registered_task(self.task_name),
             params=self.params,
@@ -174,13 +265,19 @@ class Log(BaseModel):
     error = fields.TextField(null=True)
     retries = fields.IntField(default=0)
 
-    async def to_schema(self) -> LogSchema:
-        """Convert DB model to Pydantic schema"""
-        return LogSchema(
+    async def to_schema(self, job_schema: Optional[JobSchema] = None) -> LogSchema:
+        """Convert DB model to Pydantic schema.
+
+        Callers serializing many logs can resolve the job schema once per
+        unique job and pass it in, instead of rebuilding it per log row.
+        """
+        return LogSchema.model_construct(
             id=self.id,
-            job_id=self.job.id,
-            job=await self.job.to_schema(),
-            status=self.status,
+            # Read the FK column directly instead of going through the
+            # relation, which lazily fetches the whole Job row.
+            job_id=self.job_id,
+            job=job_schema if job_schema is not None else await self.job.to_schema(),
+            status=_STATUS_LOOKUP.get(self.status, self.status),
             started_at=self.started_at,
             completed_at=self.completed_at,
             duration=self.duration,
@@ -190,6 +287,30 @@ class Log(BaseModel):
             created_at=self.created_at,
         )
 
+    @classmethod
+    async def bulk_from_schemas(cls, schemas: List[LogSchema]) -> List["Log"]:
+        """Persist many log entries with a single bulk INSERT.
+
+        One statement and one commit for the whole batch, instead of a
+        round trip (and an fsync) per log row.
+        """
+        instances = [
+            cls(
+                job_id=schema.job_id,
+                status=schema.status,
+                started_at=schema.started_at,
+                completed_at=schema.completed_at,
+                duration=schema.duration,
+                result=schema.result,
+                error=schema.error,
+                retries=schema.retries,
+            )
+            for schema in schemas
+        ]
+        if instances:
+            await cls.bulk_create(instances)
+        return instances
+
     @classmethod
     async def from_schema(cls, schema: LogSchema) -> "Log":
         """Create model from schema"""
@@ -203,3 +324,77 @@ class Log(BaseModel):
             error=schema.error,
             retries=schema.retries,
         )
+
+
+class _LogWriter:
+    """Background writer that batches Log inserts into bulk_create calls.
+
+    Per-log ``Log.create`` pays one SQLite round trip (and journal fsync)
+    per row, which dominates under bursty job execution. Producers drop
+    unsaved Log instances on a queue instead; the writer task drains up
+    to MAX_BATCH rows or waits FLUSH_INTERVAL seconds for stragglers and
+    persists each batch with a single INSERT.
+    """
+
+    MAX_BATCH = 500
+    FLUSH_INTERVAL = 0.2
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    def enqueue(self, log: Log) -> None:
+        """Queue an unsaved Log instance for the next batch."""
+        self._queue.put_nowait(log)
+
+    async def stop(self) -> None:
+        """Flush remaining rows and stop the writer task."""
+        if not self.running:
+            return
+        # The sentinel makes _run flush whatever is queued and exit, so
+        # no rows are lost on shutdown.
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    async def _flush(self, batch: List[Log]) -> None:
+        try:
+            await Log.bulk_create(batch)
+        except Exception as e:
+            logger.error("Failed to write %d log entries: %s", len(batch), str(e))
+
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    item = await asyncio.wait_for(
+                        self._queue.get(), timeout=self.FLUSH_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._flush(batch)
+            if stopping:
+                return
+
+
+# Shared writer instance; HQ starts it with the scheduler and stops it
+# (flushing the tail) on shutdown.
+log_writer = _LogWriter()
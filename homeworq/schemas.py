@@ -1,14 +1,33 @@
+import re
 from datetime import datetime
 from enum import Enum
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, computed_field, field_validator
 
 from .tasks import Task, get_registered_tasks
-from .utils import format_schedule
+from .utils import _format_interval, format_schedule
 
 T = TypeVar("T")
 
+# HH:MM with optional leading zeros, range-checked by the pattern itself.
+_AT_RE = re.compile(r"^([01]?\d|2[0-3]):([0-5]?\d)$")
+
+
+@lru_cache(maxsize=256)
+def _normalize_at(v: str) -> str:
+    """Validate and zero-pad an 'at' time string.
+
+    Schedules are highly repetitive, so the cache returns the same
+    normalized string on repeat inputs without re-matching.
+    """
+    m = _AT_RE.match(v)
+    if not m:
+        raise ValueError("'at' must be in HH:MM format (00:00-23:59)")
+    hour, minute = m.groups()
+    return f"{hour.zfill(2)}:{minute.zfill(2)}"
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
@@ -38,6 +57,13 @@ class Status(str, Enum):
     FAILED = "failed"
 
 
+# Direct value->member maps for converting raw DB strings: one dict hit
+# instead of the Enum metaclass __call__ and missing-value machinery.
+# Pydantic validators on external input are untouched.
+_UNIT_LOOKUP = {u.value: u for u in TimeUnit}
+_STATUS_LOOKUP = {s.value: s for s in Status}
+
+
 class Settings(BaseModel):
     api_on: bool = Field(
         False,
@@ -75,20 +101,26 @@ class JobSchedule(BaseModel):
     @classmethod
     def validate_at_time(cls, v: Optional[str]) -> Optional[str]:
         if v is not None:
-            try:
-                hour, minute = map(int, v.split(":"))
-                if not (0 <= hour < 24 and 0 <= minute < 60):
-                    raise ValueError("Invalid hour/minute values")
-                return f"{hour:02d}:{minute:02d}"
-            except ValueError as e:
-                s = "'at' must be in HH:MM format (00:00-23:59)"
-                raise ValueError(s) from e
+            return _normalize_at(v)
         return v
 
-    def __str__(self):
+    @cached_property
+    def human_readable(self) -> str:
+        # Schedules are immutable once built, so the description is
+        # rendered once per instance; format_schedule returns this
+        # directly instead of re-deriving it per call
+        return _format_interval(self.interval, self.unit.value, self.at)
+
+    @cached_property
+    def _display(self) -> str:
         unit = self.unit.value[:-1] if self.interval == 1 else self.unit.value
         return f"every {self.interval if self.interval != 1 else ''} {unit}{' at ' + self.at if self.at else ''}"
 
+    def __str__(self):
+        # Schedules are effectively immutable once built, so the display
+        # string is computed once and reused
+        return self._display
+
 
 class JobOptions(BaseModel):
     timeout: Optional[int] = Field(None, ge=1)
@@ -96,13 +128,22 @@ class JobOptions(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
+    # Display labels precomputed once instead of title-casing field names
+    # through model_dump on every call
+    _LABELS = {
+        "timeout": "Timeout",
+        "max_retries": "Max Retries",
+        "start_date": "Start Date",
+        "end_date": "End Date",
+    }
+
     def __str__(self):
-        d = self.model_dump()
-        return "\n".join(
-            f"{' '.join([s.title() for s in k.split('_')])}={v}"
-            for k, v in d.items()
-            if v is not None
-        )
+        parts = []
+        for attr, label in self._LABELS.items():
+            v = getattr(self, attr)
+            if v is not None:
+                parts.append(f"{label}={v}")
+        return "\n".join(parts)
 
 
 class JobBase(BaseModel):
@@ -134,21 +175,24 @@ class JobUpdate(JobBase):
 
 class Job(JobBase):
     id: str
-    name: Optional[str] = None
     task: Task
     created_at: datetime
     updated_at: datetime
     last_run: Optional[datetime] = None
     next_run: Optional[datetime] = None
 
-    def __str__(self):
+    @computed_field  # still serialized for API consumers and templates
+    @cached_property
+    def name(self) -> str:
+        # Computed lazily on first access instead of eagerly in
+        # model_post_init, so list endpoints that never read the name
+        # skip the schedule formatting entirely
         t = f"{(self.task.title or self.task.name).title()}"
         s = self.display_schedule().title()
         return f"{s}: {t}"
 
-    def model_post_init(self, __context):
-        super().model_post_init(__context)
-        self.name = str(self)
+    def __str__(self):
+        return self.name
 
     def display_schedule(self) -> str:
         return format_schedule(self.schedule)
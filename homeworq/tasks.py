@@ -1,8 +1,9 @@
-from functools import lru_cache
+import sys
 from inspect import iscoroutinefunction
-from typing import Any, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Task(BaseModel):
@@ -11,9 +12,18 @@ class Task(BaseModel):
     description: Optional[str] = None
     func: Optional[Callable] = Field(None, exclude=True)
 
+    # Registry entries never change after registration; freezing makes
+    # that explicit and lets instances be shared and hashed safely
+    model_config = ConfigDict(frozen=True)
+
 
 _REGISTRY: Dict[str, Task] = {}
 
+# Public read-only view over the live registry. register_task mutates the
+# private dict; everyone else reads through this proxy, which tracks those
+# mutations with no copying and cannot be written to.
+REGISTRY: Mapping[str, Task] = MappingProxyType(_REGISTRY)
+
 
 def register_task(title: str = None):
     """Decorator to register an async task with metadata."""
@@ -22,9 +32,14 @@ def register_task(title: str = None):
         if not iscoroutinefunction(func):
             raise ValueError(f"Task {func.__name__} must be an async function")
 
-        _REGISTRY[func.__name__] = Task(
-            name=func.__name__,
-            title=title or func.__name__,
+        # Intern the registry key so the scheduler's repeated lookups by
+        # task name can short-circuit on pointer equality.
+        name = sys.intern(func.__name__)
+        # All four fields are derived from the decorated function itself,
+        # so skip pydantic validation on construction
+        _REGISTRY[name] = Task.model_construct(
+            name=name,
+            title=title or name,
             description=func.__doc__,
             func=func,
         )
@@ -33,9 +48,8 @@ def register_task(title: str = None):
     return decorator
 
 
-@lru_cache
-def get_registered_tasks() -> Dict[str, Task]:
-    return _REGISTRY
+def get_registered_tasks() -> Mapping[str, Task]:
+    return REGISTRY
 
 
 def get_registered_task(name: str) -> Task:
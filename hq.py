@@ -17,11 +17,17 @@ async def ping(url: str) -> Dict[str, Any]:
     Returns:
         Dict containing status code and headers
     """
-    with urllib.request.urlopen(url) as response:
-        return {
-            "status": response.status,
-            "headers": dict(response.headers),
-        }
+
+    def _fetch() -> Dict[str, Any]:
+        with urllib.request.urlopen(url) as response:
+            return {
+                "status": response.status,
+                "headers": dict(response.headers),
+            }
+
+    # urlopen blocks, which would stall the scheduler's event loop for
+    # the whole request; run it on a worker thread so pings overlap.
+    return await asyncio.to_thread(_fetch)
 
 
 @register_task(title="Data Processing")